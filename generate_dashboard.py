@@ -5,94 +5,217 @@ Uses GitHub API to collect repository data and generate charts
 """
 
 import os
-import requests
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
+import asyncio
+import hashlib
+import heapq
+import aiohttp
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from collections import defaultdict
-import json
 
 # Settings
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
-HEADERS = {
-    'Authorization': f'token {GITHUB_TOKEN}',
-    'Accept': 'application/vnd.github.v3+json'
-}
+HEADERS = {'Accept': 'application/vnd.github.v3+json'}
+if GITHUB_TOKEN:
+    HEADERS['Authorization'] = f'token {GITHUB_TOKEN}'
 
 # Create directories
 os.makedirs('charts', exist_ok=True)
 os.makedirs('docs', exist_ok=True)
+os.makedirs('.cache', exist_ok=True)
+
+ETAG_CACHE_FILE = '.cache/etags.json'
+LAST_HASH_FILE = '.cache/last_hash'
+
+def load_etag_cache():
+    """Load the ETag cache mapping full_name -> {etag, payload}"""
+    try:
+        with open(ETAG_CACHE_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def save_etag_cache(cache):
+    """Persist the ETag cache for the next run"""
+    with open(ETAG_CACHE_FILE, 'wb') as f:
+        f.write(orjson.dumps(cache, option=orjson.OPT_SORT_KEYS))
+
+def compute_repos_hash(repos_data):
+    """Stable fingerprint of the fetched data, used to detect no-change runs"""
+    canonical = orjson.dumps(sorted(repos_data, key=lambda repo: repo['full_name']),
+                             option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(canonical).hexdigest()
+
+def load_last_hash():
+    """Read the fingerprint of the previous run, if any"""
+    try:
+        with open(LAST_HASH_FILE, encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def save_last_hash(repos_hash):
+    """Record the fingerprint of this run for the next one"""
+    with open(LAST_HASH_FILE, 'w', encoding='utf-8') as f:
+        f.write(repos_hash)
+
+# Popular repositories to track
+REPOS_TO_TRACK = [
+    'facebook/react',
+    'microsoft/vscode',
+    'google/tensorflow',
+    'apple/swift',
+    'netflix/zuul',
+    'amazon/aws-sdk-js',
+    'stripe/stripe-js',
+    'twilio/twilio-python'
+]
+
+def build_graphql_query():
+    """Build one GraphQL query fetching every tracked repo via aliases"""
+    fields = 'name nameWithOwner owner { login } stargazerCount primaryLanguage { name } createdAt updatedAt'
+    parts = []
+    for i, repo_name in enumerate(REPOS_TO_TRACK):
+        owner, name = repo_name.split('/')
+        parts.append(f'r{i}: repository(owner: "{owner}", name: "{name}") {{ {fields} }}')
+    return '{ %s }' % ' '.join(parts)
+
+async def fetch_repos_graphql(session):
+    """Fetch all tracked repos in a single GraphQL request
+
+    Returns None on a non-200 response so the caller can fall back to REST.
+    """
+    async with session.post('https://api.github.com/graphql',
+                            json={'query': build_graphql_query()}) as response:
+        if response.status != 200:
+            print(f"GraphQL request failed: {response.status}")
+            return None
+
+        payload = orjson.loads(await response.read())
 
-def get_github_data():
-    """Get repository data from GitHub API"""
     repos_data = []
+    for i, repo_name in enumerate(REPOS_TO_TRACK):
+        repo_data = (payload.get('data') or {}).get(f'r{i}')
+        if repo_data is None:
+            print(f"Failed to get data for {repo_name}")
+            continue
+        language = repo_data['primaryLanguage']
+        repos_data.append({
+            'name': repo_data['name'],
+            'full_name': repo_data['nameWithOwner'],
+            'owner': repo_data['owner']['login'],
+            'stars': repo_data['stargazerCount'],
+            'language': language['name'] if language else 'Unknown',
+            'created_at': repo_data['createdAt'],
+            'updated_at': repo_data['updatedAt']
+        })
 
-    # Popular repositories to track
-    repos_to_track = [
-        'facebook/react',
-        'microsoft/vscode',
-        'google/tensorflow',
-        'apple/swift',
-        'netflix/zuul',
-        'amazon/aws-sdk-js',
-        'stripe/stripe-js',
-        'twilio/twilio-python'
-    ]
-
-    for repo_name in repos_to_track:
-        try:
-            url = f'https://api.github.com/repos/{repo_name}'
-            response = requests.get(url, headers=HEADERS)
-
-            if response.status_code == 200:
-                repo_data = response.json()
-                repos_data.append({
-                    'name': repo_data['name'],
-                    'full_name': repo_data['full_name'],
-                    'owner': repo_data['owner']['login'],
-                    'stars': repo_data['stargazers_count'],
-                    'language': repo_data['language'] or 'Unknown',
-                    'created_at': repo_data['created_at'],
-                    'updated_at': repo_data['updated_at']
-                })
-            else:
-                print(f"Failed to get data for {repo_name}: {response.status_code}")
-
-        except Exception as e:
-            print(f"Error processing {repo_name}: {e}")
+    return repos_data
+
+async def fetch_repo(session, repo_name, etag_cache):
+    """Fetch one repository from the GitHub API, reusing cached data on 304"""
+    url = f'https://api.github.com/repos/{repo_name}'
+    headers = {}
+    cached = etag_cache.get(repo_name)
+    if cached:
+        headers['If-None-Match'] = cached['etag']
+
+    async with session.get(url, headers=headers) as response:
+        if response.status == 304:
+            return cached['payload']
+
+        if response.status != 200:
+            print(f"Failed to get data for {repo_name}: {response.status}")
+            return None
+
+        repo_data = orjson.loads(await response.read())
+        payload = {
+            'name': repo_data['name'],
+            'full_name': repo_data['full_name'],
+            'owner': repo_data['owner']['login'],
+            'stars': repo_data['stargazers_count'],
+            'language': repo_data['language'] or 'Unknown',
+            'created_at': repo_data['created_at'],
+            'updated_at': repo_data['updated_at']
+        }
+
+        etag = response.headers.get('ETag')
+        if etag:
+            etag_cache[repo_name] = {'etag': etag, 'payload': payload}
+
+        return payload
+
+async def get_github_data():
+    """Get repository data from GitHub API
+
+    With a token, one GraphQL request covers every tracked repo; without
+    one (GraphQL requires auth), or if the GraphQL request fails, the
+    repos are fetched concurrently via REST.
+    """
+    connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+        if GITHUB_TOKEN:
+            try:
+                repos_data = await fetch_repos_graphql(session)
+            except (aiohttp.ClientError, asyncio.TimeoutError,
+                    orjson.JSONDecodeError) as e:
+                print(f"GraphQL request failed: {e}")
+                repos_data = None
+            if repos_data is not None:
+                return repos_data
+            print("Falling back to REST requests")
+
+        etag_cache = load_etag_cache()
+        results = await asyncio.gather(
+            *[fetch_repo(session, repo_name, etag_cache) for repo_name in REPOS_TO_TRACK],
+            return_exceptions=True
+        )
+        save_etag_cache(etag_cache)
+
+    repos_data = []
+    for repo_name, result in zip(REPOS_TO_TRACK, results):
+        if isinstance(result, Exception):
+            print(f"Error processing {repo_name}: {result}")
+        elif result is not None:
+            repos_data.append(result)
 
     return repos_data
 
-def generate_overview_chart(repos_data):
+def make_figure(figsize):
+    """Create a standalone Agg-backed figure (safe to use off the main thread)"""
+    # Deferred import: matplotlib costs ~1s of cold start and is only
+    # needed when the charts are actually regenerated
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+def generate_overview_chart(df, top10):
     """Generate market overview chart"""
-    if not repos_data:
+    if df.empty:
         return
 
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
+    fig = make_figure((12, 8))
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
     fig.suptitle('GitHub Repositories Market Overview', fontsize=16)
 
     # Stars distribution
-    stars = [repo['stars'] for repo in repos_data]
-    ax1.hist(stars, bins=20, color='#1f77b4', alpha=0.7)
+    ax1.hist(df['stars'].to_numpy(), bins=20, color='#1f77b4', alpha=0.7)
     ax1.set_title('Stars Distribution')
     ax1.set_xlabel('Stars Count')
     ax1.set_ylabel('Number of Repositories')
 
     # Popular languages
-    languages = defaultdict(int)
-    for repo in repos_data:
-        languages[repo['language']] += 1
-
-    top_langs = sorted(languages.items(), key=lambda x: x[1], reverse=True)[:8]
-    if top_langs:
-        langs, counts = zip(*top_langs)
-        ax2.bar(langs, counts, color='#ff7f0e')
+    top_langs = df['language'].value_counts().head(8)
+    if not top_langs.empty:
+        ax2.bar(top_langs.index, top_langs.to_numpy(), color='#ff7f0e')
         ax2.set_title('Popular Languages')
         ax2.tick_params(axis='x', rotation=45)
 
     # Top repositories by stars
-    top_repos = sorted(repos_data, key=lambda x: x['stars'], reverse=True)[:10]
+    top_repos = top10
     names = [repo['name'][:15] + '...' if len(repo['name']) > 15 else repo['name'] for repo in top_repos]
     stars_count = [repo['stars'] for repo in top_repos]
 
@@ -100,50 +223,44 @@ def generate_overview_chart(repos_data):
     ax3.set_title('Top Repositories by Stars')
 
     # Repository owners
-    owners = defaultdict(int)
-    for repo in repos_data:
-        owners[repo['owner']] += 1
-
-    top_owners = sorted(owners.items(), key=lambda x: x[1], reverse=True)[:8]
-    if top_owners:
-        owner_names, owner_counts = zip(*top_owners)
-        ax4.bar(owner_names, owner_counts, color='#9467bd')
+    top_owners = df['owner'].value_counts().head(8)
+    if not top_owners.empty:
+        ax4.bar(top_owners.index, top_owners.to_numpy(), color='#9467bd')
         ax4.set_title('Repository Owners')
         ax4.tick_params(axis='x', rotation=45)
 
-    plt.tight_layout()
-    plt.savefig('charts/overview.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig('charts/overview.webp', dpi=120, bbox_inches='tight',
+                pil_kwargs={'quality': 85, 'method': 4})
 
-def generate_language_chart(repos_data):
+def generate_language_chart(df):
     """Generate language popularity chart"""
-    languages = defaultdict(int)
-    for repo in repos_data:
-        languages[repo['language']] += 1
-
-    if languages:
-        plt.figure(figsize=(10, 6))
-        langs = list(languages.keys())
-        counts = list(languages.values())
-
-        sorted_data = sorted(zip(langs, counts), key=lambda x: x[1], reverse=True)
-        langs, counts = zip(*sorted_data)
-
-        plt.bar(langs, counts, color='#e74c3c')
-        plt.title('Programming Languages in Tracked Repositories')
-        plt.xticks(rotation=45, ha='right')
-        plt.ylabel('Number of Repositories')
-        plt.tight_layout()
-        plt.savefig('charts/languages.png', dpi=150, bbox_inches='tight')
-        plt.close()
-
-def update_readme(repos_data):
+    languages = df['language'].value_counts() if not df.empty else None
+
+    if languages is not None and not languages.empty:
+        fig = make_figure((10, 6))
+        ax = fig.subplots()
+        ax.bar(languages.index, languages.to_numpy(), color='#e74c3c')
+        ax.set_title('Programming Languages in Tracked Repositories')
+        for label in ax.get_xticklabels():
+            label.set_rotation(45)
+            label.set_horizontalalignment('right')
+        ax.set_ylabel('Number of Repositories')
+        fig.tight_layout()
+        fig.savefig('charts/languages.webp', dpi=120, bbox_inches='tight',
+                    pil_kwargs={'quality': 85, 'method': 4})
+
+def update_readme(repos_data, top10, total_stars):
     """Update README.md with current data"""
     total_repos = len(repos_data)
-    total_stars = sum(repo['stars'] for repo in repos_data)
     avg_stars = total_stars // total_repos if total_repos > 0 else 0
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M UTC')
 
-    top_repos = sorted(repos_data, key=lambda x: x['stars'], reverse=True)[:5]
+    top_repos = top10[:5]
+    table_rows = '\n'.join(
+        f"| [{repo['name']}](https://github.com/{repo['full_name']}) | {repo['owner']} | ⭐ {repo['stars']:,} | {repo['language']} |"
+        for repo in top_repos
+    )
 
     readme_content = f"""# NickScherbakov-dashboard
 
@@ -157,26 +274,35 @@ Monitoring GitHub repository market - tracking popular projects and technologies
 - **Average Stars**: {avg_stars:,}
 
 ### 📊 Market Overview
-![Market Overview](charts/overview.png)
+![Market Overview](charts/overview.webp)
 
 ### 🏷️ Popular Languages
-![Languages](charts/languages.png)
+![Languages](charts/languages.webp)
 
 ### 🔝 Top 5 Repositories
 | Repository | Owner | Stars | Language |
 |------------|-------|-------|----------|
-"""
-
-    for repo in top_repos:
-        readme_content += f"| [{repo['name']}](https://github.com/{repo['full_name']}) | {repo['owner']} | ⭐ {repo['stars']:,} | {repo['language']} |\n"
+{table_rows}
 
-    readme_content += f"\n*Dashboard updates automatically every 6 hours. Last update: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}*"
+*Dashboard updates automatically every 6 hours. Last update: {now_str}*"""
 
     with open('README.md', 'w', encoding='utf-8') as f:
         f.write(readme_content)
 
-def create_index_html(repos_data):
+def create_index_html(repos_data, top10, total_stars):
     """Create index.html for GitHub Pages"""
+    avg_stars = total_stars // len(repos_data) if repos_data else 0
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M UTC')
+    table_rows = '\n'.join(
+        f"""                <tr>
+                    <td><a href="https://github.com/{repo['full_name']}" target="_blank">{repo['name']}</a></td>
+                    <td>{repo['owner']}</td>
+                    <td>⭐ {repo['stars']:,}</td>
+                    <td>{repo['language']}</td>
+                </tr>"""
+        for repo in top10
+    )
+
     html_content = f"""<!DOCTYPE html>
 <html lang="ru">
 <head>
@@ -261,23 +387,23 @@ def create_index_html(repos_data):
                 <p>Tracked Repositories</p>
             </div>
             <div class="stat-card">
-                <h3>{sum(repo['stars'] for repo in repos_data):,}</h3>
+                <h3>{total_stars:,}</h3>
                 <p>Total Stars</p>
             </div>
             <div class="stat-card">
-                <h3>{sum(repo['stars'] for repo in repos_data) // len(repos_data) if repos_data else 0:,}</h3>
+                <h3>{avg_stars:,}</h3>
                 <p>Average Stars</p>
             </div>
         </div>
 
         <div class="chart-container">
             <h2>📊 Market Overview</h2>
-            <img src="charts/overview.png" alt="Market Overview Chart">
+            <img src="charts/overview.webp" alt="Market Overview Chart">
         </div>
 
         <div class="chart-container">
             <h2>🏷️ Popular Languages</h2>
-            <img src="charts/languages.png" alt="Languages Chart">
+            <img src="charts/languages.webp" alt="Languages Chart">
         </div>
 
         <h2>🔝 Top Repositories</h2>
@@ -290,24 +416,13 @@ def create_index_html(repos_data):
                     <th>Language</th>
                 </tr>
             </thead>
-            <tbody>"""
-
-    top_repos = sorted(repos_data, key=lambda x: x['stars'], reverse=True)[:10]
-    for repo in top_repos:
-        html_content += f"""
-                <tr>
-                    <td><a href="https://github.com/{repo['full_name']}" target="_blank">{repo['name']}</a></td>
-                    <td>{repo['owner']}</td>
-                    <td>⭐ {repo['stars']:,}</td>
-                    <td>{repo['language']}</td>
-                </tr>"""
-
-    html_content += f"""
+            <tbody>
+{table_rows}
             </tbody>
         </table>
 
         <div class="update-time">
-            📅 Last update: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
+            📅 Last update: {now_str}
         </div>
     </div>
 </body>
@@ -322,7 +437,7 @@ def main():
 
     # Get data
     print("📊 Getting data from GitHub API...")
-    repos_data = get_github_data()
+    repos_data = asyncio.run(get_github_data())
 
     if not repos_data:
         print("❌ Failed to get data")
@@ -330,18 +445,38 @@ def main():
 
     print(f"✅ Got data for {len(repos_data)} repositories")
 
-    # Generate charts
-    print("📈 Generating charts...")
-    generate_overview_chart(repos_data)
-    generate_language_chart(repos_data)
-
-    # Update README
-    print("📝 Updating README...")
-    update_readme(repos_data)
+    # Rank and aggregate once, then share across charts and templates
+    top10 = heapq.nlargest(10, repos_data, key=lambda repo: repo['stars'])
+    total_stars = sum(repo['stars'] for repo in repos_data)
 
-    # Create HTML page
-    print("🌐 Creating HTML page...")
-    create_index_html(repos_data)
+    # Skip the PNG renders entirely when the data matches the previous run
+    repos_hash = compute_repos_hash(repos_data)
+    charts_fresh = (repos_hash == load_last_hash()
+                    and os.path.exists('charts/overview.webp')
+                    and os.path.exists('charts/languages.webp'))
+
+    # Charts, README and HTML are independent once the data is in hand,
+    # so render and write them concurrently
+    print("📈 Generating charts and pages...")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(update_readme, repos_data, top10, total_stars),
+            executor.submit(create_index_html, repos_data, top10, total_stars),
+        ]
+        if charts_fresh:
+            print("⏭️  Data unchanged since last run, keeping existing charts")
+        else:
+            # pandas is only needed for chart aggregation, so its import
+            # is skipped entirely on no-change runs
+            import pandas as pd
+            df = pd.DataFrame(repos_data)
+            futures.append(executor.submit(generate_overview_chart, df, top10))
+            futures.append(executor.submit(generate_language_chart, df))
+        for future in futures:
+            future.result()
+
+    if not charts_fresh:
+        save_last_hash(repos_hash)
 
     print("🎉 Dashboard updated successfully!")
 
@@ -6,52 +6,58 @@ Verifies that all required dependencies and environment setup is correct
 
 import sys
 import subprocess
-import importlib
 import platform
 import shutil
 import os
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import version, PackageNotFoundError
 
 def check_python_version():
-    """Check if Python version is 3.7+"""
+    """Check if Python version is 3.8+ (importlib.metadata needs 3.8)"""
     version = sys.version_info
-    if version.major >= 3 and version.minor >= 7:
+    if version.major >= 3 and version.minor >= 8:
         print(f"✅ Python {version.major}.{version.minor}.{version.micro} (OK)")
         return True
     else:
-        print(f"❌ Python {version.major}.{version.minor}.{version.micro} (Need 3.7+)")
+        print(f"❌ Python {version.major}.{version.minor}.{version.micro} (Need 3.8+)")
         return False
 
 def check_package(package_name, min_version=None):
-    """Check if a Python package is installed"""
+    """Check if a Python package is installed (metadata only, no import)"""
     try:
-        module = importlib.import_module(package_name)
-        if hasattr(module, '__version__'):
-            version = module.__version__
-            print(f"✅ {package_name} {version}")
-        else:
-            print(f"✅ {package_name} (installed)")
-        return True
-    except ImportError:
-        print(f"❌ {package_name} (not installed)")
-        return False
+        return True, f"✅ {package_name} {version(package_name)}"
+    except PackageNotFoundError:
+        return False, f"❌ {package_name} (not installed)"
+
+def check_commands(commands):
+    """Check command-line tools with a single batched --version subprocess"""
+    available = [c for c in commands if shutil.which(c)]
 
-def check_command(command):
-    """Check if a command-line tool is available"""
-    if shutil.which(command):
+    versions = {}
+    if available:
+        # echo wraps each probe so every command yields exactly one line
+        # even when it prints its version to stderr, keeping the
+        # line-to-command mapping aligned
+        script = '; '.join(f'echo "$({c} --version 2>/dev/null | head -n1)"'
+                           for c in available)
         try:
-            result = subprocess.run([command, '--version'], 
-                                 capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                version = result.stdout.strip().split('\n')[0]
-                print(f"✅ {command}: {version}")
-            else:
-                print(f"✅ {command} (available)")
+            result = subprocess.run(['bash', '-c', script],
+                                 capture_output=True, text=True, timeout=10)
+            lines = result.stdout.split('\n')
+            if len(lines) >= len(available):
+                versions = {c: line.strip() for c, line in zip(available, lines)}
         except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-            print(f"✅ {command} (available)")
-        return True
-    else:
-        print(f"❌ {command} (not found)")
-        return False
+            pass
+
+    results = []
+    for command in commands:
+        if command not in available:
+            results.append((False, f"❌ {command} (not found)"))
+        elif versions.get(command):
+            results.append((True, f"✅ {command}: {versions[command]}"))
+        else:
+            results.append((True, f"✅ {command} (available)"))
+    return results
 
 def check_disk_space():
     """Check available disk space"""
@@ -72,14 +78,18 @@ def check_disk_space():
 
 def check_network():
     """Check network connectivity to GitHub"""
+    import urllib.error
+    import urllib.request
     try:
-        import urllib.request
-        urllib.request.urlopen('https://api.github.com', timeout=10)
-        print("✅ Network connectivity to GitHub API")
-        return True
+        request = urllib.request.Request('https://api.github.com', method='HEAD')
+        urllib.request.urlopen(request, timeout=5)
+        return True, "✅ Network connectivity to GitHub API"
+    except urllib.error.HTTPError:
+        # Got an HTTP response back, so the network path works even if
+        # GitHub rejects the unauthenticated HEAD
+        return True, "✅ Network connectivity to GitHub API"
     except Exception as e:
-        print(f"❌ Network connectivity to GitHub API: {e}")
-        return False
+        return False, f"❌ Network connectivity to GitHub API: {e}"
 
 def main():
     """Run all health checks"""
@@ -95,41 +105,52 @@ def main():
     print(f"   Architecture: {platform.machine()}")
     print(f"   Python executable: {sys.executable}")
     
-    # Core requirements
-    print(f"\n🐍 Python Environment:")
-    total_checks += 1
-    if check_python_version():
-        checks_passed += 1
-    
-    # Required packages
-    print(f"\n📦 Required Packages:")
-    required_packages = ['requests', 'matplotlib', 'seaborn', 'pandas']
-    
-    for package in required_packages:
+    # Package, command and network probes are independent, so run them
+    # in parallel and only serialize the printing per section
+    required_packages = ['aiohttp', 'orjson', 'matplotlib', 'pandas', 'Pillow']
+    required_commands = ['git', 'pip']
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        package_futures = [executor.submit(check_package, p) for p in required_packages]
+        commands_future = executor.submit(check_commands, required_commands)
+        network_future = executor.submit(check_network)
+
+        # Core requirements
+        print(f"\n🐍 Python Environment:")
         total_checks += 1
-        if check_package(package):
+        if check_python_version():
             checks_passed += 1
-    
-    # Command-line tools
-    print(f"\n🛠️  Command-line Tools:")
-    required_commands = ['git', 'pip']
-    
-    for command in required_commands:
+
+        # Required packages
+        print(f"\n📦 Required Packages:")
+        for future in package_futures:
+            total_checks += 1
+            passed, message = future.result()
+            print(message)
+            if passed:
+                checks_passed += 1
+
+        # Command-line tools
+        print(f"\n🛠️  Command-line Tools:")
+        for passed, message in commands_future.result():
+            total_checks += 1
+            print(message)
+            if passed:
+                checks_passed += 1
+
+        # System resources
+        print(f"\n💻 System Resources:")
         total_checks += 1
-        if check_command(command):
+        if check_disk_space():
+            checks_passed += 1
+
+        # Network connectivity
+        print(f"\n🌐 Network:")
+        total_checks += 1
+        passed, message = network_future.result()
+        print(message)
+        if passed:
             checks_passed += 1
-    
-    # System resources
-    print(f"\n💻 System Resources:")
-    total_checks += 1
-    if check_disk_space():
-        checks_passed += 1
-    
-    # Network connectivity
-    print(f"\n🌐 Network:")
-    total_checks += 1
-    if check_network():
-        checks_passed += 1
     
     # Summary
     print(f"\n📊 Health Check Summary:")
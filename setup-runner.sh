@@ -39,16 +39,16 @@ if command_exists python3; then
     PYTHON_VERSION=$(python3 --version | grep -oE '[0-9]+\.[0-9]+')
     echo "✅ Python 3 found: $(python3 --version)"
     
-    # Check if version is 3.7+
-    if python3 -c "import sys; exit(0 if sys.version_info >= (3,7) else 1)"; then
+    # Check if version is 3.8+
+    if python3 -c "import sys; exit(0 if sys.version_info >= (3,8) else 1)"; then
         echo "✅ Python version is compatible"
     else
-        echo "❌ Python 3.7+ required, found: $PYTHON_VERSION"
+        echo "❌ Python 3.8+ required, found: $PYTHON_VERSION"
         exit 1
     fi
 else
     echo "❌ Python 3 not found"
-    echo "Please install Python 3.7+ before running this script"
+    echo "Please install Python 3.8+ before running this script"
     exit 1
 fi
 
@@ -101,7 +101,7 @@ python -m pip install --upgrade pip
 
 # Install required packages
 echo "📦 Installing required Python packages..."
-pip install requests>=2.25.0 matplotlib>=3.3.0 seaborn>=0.11.0 pandas>=1.2.0
+pip install -r requirements.txt
 
 echo "✅ All dependencies installed successfully"
 
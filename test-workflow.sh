@@ -27,7 +27,7 @@ fi
 
 # Test requirements installation
 echo "3. Testing requirements installation..."
-if $PYTHON_CMD -c "import requests, matplotlib, seaborn, pandas" 2>/dev/null; then
+if $PYTHON_CMD -c "import aiohttp, orjson, matplotlib, pandas, PIL" 2>/dev/null; then
     echo "✅ All required packages are available"
 else
     echo "❌ Some required packages are missing"